@@ -1,16 +1,163 @@
+import operator
+from functools import reduce
+
 from django.contrib import admin
+from django.contrib.admin.utils import lookup_spawns_duplicates
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.postgres.search import SearchQuery
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils.functional import cached_property
 from django.utils.html import format_html
+from django.utils.text import smart_split, unescape_string_literal
 from .models import Doctor, Patient, Appointment, PatientDischargeDetails
 
 
+_TOTAL_OK_TMPL = '<span style="color: green;">✓ Correct: ${}</span>'
+_TOTAL_MISMATCH_TMPL = '<span style="color: red;">⚠ Mismatch: ${} (should be {})</span>'
+
+
+class PrefixSearchMixin:
+    """Admin search where ``^field`` / ``=field`` compare LOWER(field), which functional indexes can serve."""
+    trigram_search_fields = []
+    full_text_search_field = None
+
+    def get_search_results(self, request, queryset, search_term):
+        search_fields = self.get_search_fields(request)
+        search_term = search_term.strip()
+        if not search_term or not search_fields:
+            return queryset, False
+
+        lookups = []
+        aliases = {}
+        for i, field in enumerate(search_fields):
+            if field.startswith('^'):
+                name = '_search_%d' % i
+                aliases[name] = Lower(field[1:])
+                lookups.append('%s__startswith' % name)
+            elif field.startswith('='):
+                name = '_search_%d' % i
+                aliases[name] = Lower(field[1:])
+                lookups.append('%s__exact' % name)
+            else:
+                lookups.append('%s__icontains' % field)
+        is_postgresql = connections[queryset.db].vendor == 'postgresql'
+        trigram_lookup = 'trigram_word_similar' if is_postgresql else 'icontains'
+        lookups += ['%s__%s' % (field, trigram_lookup) for field in self.trigram_search_fields]
+        queryset = queryset.alias(**aliases)
+        condition = Q()
+        for bit in smart_split(search_term):
+            if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
+                bit = unescape_string_literal(bit)
+            bit = bit.lower()
+            condition &= reduce(operator.or_, (Q(**{lookup: bit}) for lookup in lookups))
+
+        if is_postgresql and self.full_text_search_field:
+            condition |= Q(**{self.full_text_search_field: SearchQuery(search_term, config='english')})
+
+        may_have_duplicates = any(
+            lookup_spawns_duplicates(self.opts, field.lstrip('^=@'))
+            for field in list(search_fields) + list(self.trigram_search_fields)
+        )
+        return queryset.filter(condition), may_have_duplicates
+
+
+class ApproxCountPaginator(Paginator):
+    """
+    Paginator that reads PostgreSQL's row estimate instead of running COUNT(*).
+
+    Only unfiltered changelists of large tables use the estimate; filtered
+    querysets, small tables and other backends still get an exact count.
+    """
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        db_connection = connections[queryset.db]
+        if db_connection.vendor == 'postgresql' and not queryset.query.where:
+            with db_connection.cursor() as cursor:
+                # to_regclass() resolves the table through search_path, so a
+                # same-named table in another schema isn't picked up
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)',
+                    [db_connection.ops.quote_name(queryset.model._meta.db_table)],
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= self.exact_count_threshold:
+                return row[0]
+        return super().count
+
+
+class DoctorListFilter(admin.RelatedFieldListFilter):
+    """Doctor filter whose choices join ``user``, which ``Doctor.__str__`` reads."""
+
+    def field_choices(self, field, request, model_admin):
+        doctors = field.related_model._default_manager.select_related('user')
+        ordering = self.field_admin_ordering(field, request, model_admin)
+        if ordering:
+            doctors = doctors.order_by(*ordering)
+        return [(doctor.pk, str(doctor)) for doctor in doctors]
+
+
+class NarrowChangeList(ChangeList):
+    """
+    ChangeList that loads only ``model_admin.changelist_only_fields`` per row,
+    or everything but ``model_admin.changelist_defer_fields``.
+    """
+
+    def get_queryset(self, request, *args, **kwargs):
+        queryset = super().get_queryset(request, *args, **kwargs)
+        only_fields = self.model_admin.changelist_only_fields
+        if only_fields:
+            return queryset.only(*only_fields)
+        defer_fields = self.model_admin.changelist_defer_fields
+        return queryset.defer(*defer_fields) if defer_fields else queryset
+
+
+class NarrowChangeListMixin:
+    """
+    Restrict changelist rows to the columns list_display actually renders.
+
+    Wide TextFields and file paths are otherwise read for every row. The
+    change form still uses ``get_queryset`` and loads the full object.
+    """
+    changelist_only_fields = None
+    changelist_defer_fields = None
+
+    def get_changelist(self, request, **kwargs):
+        return NarrowChangeList
+
+
+class SelectRelatedQuerysetMixin:
+    """
+    Join ``list_select_related`` in ``get_queryset`` as well as on the changelist.
+
+    Autocomplete widgets on other admins label each result with ``__str__``,
+    which reads these relations. ChangeList skips ``list_select_related`` once
+    any ``select_related`` is set, so the same list is used here.
+    """
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related(*self.list_select_related)
+
+
 @admin.register(Doctor)
-class DoctorAdmin(admin.ModelAdmin):
+class DoctorAdmin(PrefixSearchMixin, NarrowChangeListMixin, SelectRelatedQuerysetMixin, admin.ModelAdmin):
     list_display = ['get_name', 'department', 'mobile', 'status', 'experience_years', 'consultation_fee', 'created_at']
     list_filter = ['status', 'department', 'created_at']
-    search_fields = ['user__first_name', 'user__last_name', 'mobile', 'department']
+    search_fields = ['^user__first_name', '^user__last_name', '^mobile', '^department']
     readonly_fields = ['created_at', 'updated_at']
     list_editable = ['status']
+    list_select_related = ['user']
+    changelist_only_fields = [
+        'user__first_name', 'user__last_name', 'department', 'mobile', 'status',
+        'experience_years', 'consultation_fee', 'created_at',
+    ]
     list_per_page = 25
+    show_full_result_count = False
     date_hierarchy = 'created_at'
     
     fieldsets = (
@@ -36,13 +183,23 @@ class DoctorAdmin(admin.ModelAdmin):
 
 
 @admin.register(Patient)
-class PatientAdmin(admin.ModelAdmin):
+class PatientAdmin(PrefixSearchMixin, NarrowChangeListMixin, SelectRelatedQuerysetMixin, admin.ModelAdmin):
     list_display = ['get_name', 'mobile', 'symptoms_short', 'assigned_doctor', 'status', 'admit_date', 'blood_group']
-    list_filter = ['status', 'blood_group', 'admit_date', 'assigned_doctor']
-    search_fields = ['user__first_name', 'user__last_name', 'mobile', 'symptoms']
+    list_filter = ['status', 'blood_group', 'admit_date', ('assigned_doctor', DoctorListFilter)]
+    search_fields = ['^user__first_name', '^user__last_name', '^mobile']
+    trigram_search_fields = ['symptoms']
+    full_text_search_field = 'search_vector'
     readonly_fields = ['created_at', 'updated_at', 'admit_date', 'age']
     list_editable = ['status']
+    list_select_related = ['user', 'assigned_doctor__user']
+    autocomplete_fields = ['assigned_doctor']
+    changelist_only_fields = [
+        'user__first_name', 'user__last_name', 'mobile', 'status', 'admit_date', 'blood_group',
+        'assigned_doctor__department', 'assigned_doctor__user__first_name', 'assigned_doctor__user__last_name',
+    ]
     list_per_page = 25
+    show_full_result_count = False
+    paginator = ApproxCountPaginator
     date_hierarchy = 'admit_date'
     
     fieldsets = (
@@ -66,19 +223,28 @@ class PatientAdmin(admin.ModelAdmin):
     get_name.short_description = 'Name'
     get_name.admin_order_field = 'user__first_name'
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_symptoms_preview()
+    
     def symptoms_short(self, obj):
-        return obj.symptoms[:50] + '...' if len(obj.symptoms) > 50 else obj.symptoms
+        preview = obj.symptoms_preview
+        return preview[:50] + '...' if len(preview) > 50 else preview
     symptoms_short.short_description = 'Symptoms'
 
 
 @admin.register(Appointment)
-class AppointmentAdmin(admin.ModelAdmin):
+class AppointmentAdmin(PrefixSearchMixin, NarrowChangeListMixin, admin.ModelAdmin):
     list_display = ['patient', 'doctor', 'appointment_date', 'status', 'created_at']
-    list_filter = ['status', 'appointment_date', 'doctor', 'created_at']
-    search_fields = ['patient__user__first_name', 'patient__user__last_name', 'doctor__user__first_name', 'doctor__user__last_name']
+    list_filter = ['status', 'appointment_date', ('doctor', DoctorListFilter), 'created_at']
+    search_fields = ['^patient__user__first_name', '^patient__user__last_name', '^doctor__user__first_name', '^doctor__user__last_name']
     readonly_fields = ['created_at', 'updated_at']
     list_editable = ['status']
+    list_select_related = ['patient__user', 'doctor__user']
+    autocomplete_fields = ['patient', 'doctor']
+    changelist_defer_fields = ['patient__profile_pic', 'doctor__profile_pic']
     list_per_page = 25
+    show_full_result_count = False
+    paginator = ApproxCountPaginator
     date_hierarchy = 'appointment_date'
     
     fieldsets = (
@@ -96,12 +262,17 @@ class AppointmentAdmin(admin.ModelAdmin):
 
 
 @admin.register(PatientDischargeDetails)
-class PatientDischargeDetailsAdmin(admin.ModelAdmin):
+class PatientDischargeDetailsAdmin(PrefixSearchMixin, NarrowChangeListMixin, admin.ModelAdmin):
     list_display = ['patient', 'assigned_doctor', 'admit_date', 'release_date', 'day_spent', 'total', 'created_at']
-    list_filter = ['release_date', 'admit_date', 'assigned_doctor']
-    search_fields = ['patient__user__first_name', 'patient__user__last_name']
+    list_filter = ['release_date', 'admit_date', ('assigned_doctor', DoctorListFilter)]
+    search_fields = ['^patient__user__first_name', '^patient__user__last_name']
     readonly_fields = ['created_at', 'updated_at', 'calculate_total']
+    list_select_related = ['patient__user', 'assigned_doctor__user']
+    autocomplete_fields = ['patient', 'assigned_doctor']
+    changelist_defer_fields = ['patient__profile_pic', 'assigned_doctor__profile_pic']
     list_per_page = 25
+    show_full_result_count = False
+    paginator = ApproxCountPaginator
     date_hierarchy = 'release_date'
     
     fieldsets = (
@@ -122,10 +293,10 @@ class PatientDischargeDetailsAdmin(admin.ModelAdmin):
     
     def calculate_total(self, obj):
         if obj.pk:
-            calculated = float(obj.room_charge) + float(obj.medicine_cost) + float(obj.doctor_fee) + float(obj.other_charge)
-            if calculated == float(obj.total):
-                return format_html('<span style="color: green;">✓ Correct: ${}</span>', calculated)
+            calculated = obj.room_charge + obj.medicine_cost + obj.doctor_fee + obj.other_charge
+            if calculated == obj.total:
+                return format_html(_TOTAL_OK_TMPL, calculated)
             else:
-                return format_html('<span style="color: red;">⚠ Mismatch: ${} (should be {})</span>', obj.total, calculated)
+                return format_html(_TOTAL_MISMATCH_TMPL, obj.total, calculated)
         return '-'
     calculate_total.short_description = 'Total Verification'
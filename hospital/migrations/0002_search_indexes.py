@@ -0,0 +1,40 @@
+from django.conf import settings
+from django.db import migrations
+
+
+# Indexes backing the prefix/trigram admin search in hospital.admin.
+# They rely on PostgreSQL operator classes, so other backends skip them.
+SEARCH_INDEXES = [
+    ('hospital_patient_symptoms_trgm', 'hospital_patient', 'symptoms gin_trgm_ops', 'gin'),
+    ('auth_user_first_name_lower', 'auth_user', 'LOWER(first_name) varchar_pattern_ops', 'btree'),
+    ('auth_user_last_name_lower', 'auth_user', 'LOWER(last_name) varchar_pattern_ops', 'btree'),
+]
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, expression, method in SEARCH_INDEXES:
+        schema_editor.execute(
+            'CREATE INDEX IF NOT EXISTS %s ON %s USING %s (%s)' % (name, table, method, expression)
+        )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, expression, method in SEARCH_INDEXES:
+        schema_editor.execute('DROP INDEX IF EXISTS %s' % name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('hospital', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
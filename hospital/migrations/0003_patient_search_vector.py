@@ -0,0 +1,62 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Keeps Patient.search_vector in sync with symptoms. The trigger and the GIN
+# index are only created on PostgreSQL. The index is still in model state, so
+# on other backends later table remakes (SQLite ALTERs) create it as a plain
+# index on the unused column.
+TRIGGER_SQL = """
+CREATE TRIGGER hospital_patient_search_vector_update
+BEFORE INSERT OR UPDATE OF symptoms ON hospital_patient
+FOR EACH ROW EXECUTE PROCEDURE
+tsvector_update_trigger(search_vector, 'pg_catalog.english', symptoms)
+"""
+
+
+def create_search_vector_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX hospital_patient_search_gin ON hospital_patient USING gin (search_vector)'
+    )
+    schema_editor.execute(TRIGGER_SQL)
+    schema_editor.execute(
+        "UPDATE hospital_patient SET search_vector = to_tsvector('pg_catalog.english', symptoms)"
+    )
+
+
+def drop_search_vector_trigger(apps, schema_editor):
+    # Table remakes on other backends leave a plain index of the same name,
+    # which has to go before search_vector can be dropped.
+    schema_editor.execute('DROP INDEX IF EXISTS hospital_patient_search_gin')
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP TRIGGER IF EXISTS hospital_patient_search_vector_update ON hospital_patient')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hospital', '0002_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='patient',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, help_text='Full-text index of symptoms, maintained by a database trigger', null=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(
+                    model_name='patient',
+                    index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='hospital_patient_search_gin'),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_vector_trigger, drop_search_vector_trigger),
+            ],
+        ),
+    ]
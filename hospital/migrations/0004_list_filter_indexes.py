@@ -0,0 +1,69 @@
+from django.db import migrations, models
+
+
+# Composite indexes matching the admin list_filter combinations. On
+# PostgreSQL they are built CONCURRENTLY so the tables stay writable.
+LIST_FILTER_INDEXES = [
+    ('patient', models.Index(fields=['assigned_doctor', '-admit_date'], name='hospital_pa_assigne_1d7a8c_idx')),
+    ('patient', models.Index(fields=['status', 'blood_group'], name='hospital_pa_status_40f566_idx')),
+    ('patientdischargedetails', models.Index(fields=['assigned_doctor', '-release_date'], name='hospital_pa_assigne_cfeb18_idx')),
+]
+
+
+def add_list_filter_indexes(apps, schema_editor):
+    for model_name, index in LIST_FILTER_INDEXES:
+        model = apps.get_model('hospital', model_name)
+        if schema_editor.connection.vendor == 'postgresql':
+            schema_editor.add_index(model, index, concurrently=True)
+        else:
+            schema_editor.add_index(model, index)
+
+
+def remove_list_filter_indexes(apps, schema_editor):
+    for model_name, index in LIST_FILTER_INDEXES:
+        model = apps.get_model('hospital', model_name)
+        if schema_editor.connection.vendor == 'postgresql':
+            schema_editor.remove_index(model, index, concurrently=True)
+        else:
+            schema_editor.remove_index(model, index)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('hospital', '0003_patient_search_vector'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='appointment',
+            name='is_active',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AlterField(
+            model_name='doctor',
+            name='is_active',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AlterField(
+            model_name='patient',
+            name='is_active',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AlterField(
+            model_name='patientdischargedetails',
+            name='is_active',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name=model_name, index=index)
+                for model_name, index in LIST_FILTER_INDEXES
+            ],
+            database_operations=[
+                migrations.RunPython(add_list_filter_indexes, remove_list_filter_indexes),
+            ],
+        ),
+    ]
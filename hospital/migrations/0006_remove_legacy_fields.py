@@ -0,0 +1,114 @@
+# Generated by Django 5.2.18 on 2026-10-14 13:06
+
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_foreign_keys(apps, schema_editor):
+    """Point rows that only carry legacy user ids at their Doctor/Patient."""
+    Doctor = apps.get_model('hospital', 'Doctor')
+    Patient = apps.get_model('hospital', 'Patient')
+    Appointment = apps.get_model('hospital', 'Appointment')
+    PatientDischargeDetails = apps.get_model('hospital', 'PatientDischargeDetails')
+
+    def doctor_for(legacy_field):
+        return Subquery(Doctor.objects.filter(user_id=OuterRef(legacy_field)).values('pk')[:1])
+
+    def patient_for(legacy_field):
+        return Subquery(Patient.objects.filter(user_id=OuterRef(legacy_field)).values('pk')[:1])
+
+    Patient.objects.filter(assigned_doctor__isnull=True, assignedDoctorId__isnull=False).update(
+        assigned_doctor=doctor_for('assignedDoctorId')
+    )
+    Appointment.objects.filter(doctor__isnull=True, doctorId__isnull=False).update(doctor=doctor_for('doctorId'))
+    Appointment.objects.filter(patient__isnull=True, patientId__isnull=False).update(patient=patient_for('patientId'))
+    PatientDischargeDetails.objects.filter(patient__isnull=True, patientId__isnull=False).update(
+        patient=patient_for('patientId')
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('hospital', '0005_auto_timestamps'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_foreign_keys, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='appointment',
+            name='appointmentDate',
+        ),
+        migrations.RemoveField(
+            model_name='appointment',
+            name='doctorId',
+        ),
+        migrations.RemoveField(
+            model_name='appointment',
+            name='doctorName',
+        ),
+        migrations.RemoveField(
+            model_name='appointment',
+            name='patientId',
+        ),
+        migrations.RemoveField(
+            model_name='appointment',
+            name='patientName',
+        ),
+        migrations.RemoveField(
+            model_name='patient',
+            name='assignedDoctorId',
+        ),
+        migrations.RemoveField(
+            model_name='patientdischargedetails',
+            name='OtherCharge',
+        ),
+        migrations.RemoveField(
+            model_name='patientdischargedetails',
+            name='address',
+        ),
+        migrations.RemoveField(
+            model_name='patientdischargedetails',
+            name='admitDate',
+        ),
+        migrations.RemoveField(
+            model_name='patientdischargedetails',
+            name='assignedDoctorName',
+        ),
+        migrations.RemoveField(
+            model_name='patientdischargedetails',
+            name='daySpent',
+        ),
+        migrations.RemoveField(
+            model_name='patientdischargedetails',
+            name='doctorFee',
+        ),
+        migrations.RemoveField(
+            model_name='patientdischargedetails',
+            name='medicineCost',
+        ),
+        migrations.RemoveField(
+            model_name='patientdischargedetails',
+            name='mobile',
+        ),
+        migrations.RemoveField(
+            model_name='patientdischargedetails',
+            name='patientId',
+        ),
+        migrations.RemoveField(
+            model_name='patientdischargedetails',
+            name='patientName',
+        ),
+        migrations.RemoveField(
+            model_name='patientdischargedetails',
+            name='releaseDate',
+        ),
+        migrations.RemoveField(
+            model_name='patientdischargedetails',
+            name='roomCharge',
+        ),
+        migrations.RemoveField(
+            model_name='patientdischargedetails',
+            name='symptoms',
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+# LOWER(...) varchar_pattern_ops indexes for the remaining '^' admin
+# search fields (auth_user names are covered by 0002). PostgreSQL only,
+# built CONCURRENTLY so the tables stay writable.
+PREFIX_SEARCH_INDEXES = [
+    ('hospital_doctor_mobile_lower', 'hospital_doctor', 'mobile'),
+    ('hospital_doctor_department_lower', 'hospital_doctor', 'department'),
+    ('hospital_patient_mobile_lower', 'hospital_patient', 'mobile'),
+]
+
+
+def create_prefix_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in PREFIX_SEARCH_INDEXES:
+        schema_editor.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS %s ON %s (LOWER(%s) varchar_pattern_ops)' % (name, table, column)
+        )
+
+
+def drop_prefix_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in PREFIX_SEARCH_INDEXES:
+        schema_editor.execute('DROP INDEX CONCURRENTLY IF EXISTS %s' % name)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('hospital', '0006_remove_legacy_fields'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_prefix_search_indexes, drop_prefix_search_indexes),
+    ]
@@ -0,0 +1,42 @@
+from django.db import migrations, models
+
+
+# Lets the admin date drill-down read MIN/MAX(release_date) from an index.
+# On PostgreSQL it is built CONCURRENTLY so the table stays writable.
+RELEASE_DATE_INDEX = models.Index(fields=['release_date'], name='hospital_pa_release_2096c4_idx')
+
+
+def add_release_date_index(apps, schema_editor):
+    model = apps.get_model('hospital', 'patientdischargedetails')
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.add_index(model, RELEASE_DATE_INDEX, concurrently=True)
+    else:
+        schema_editor.add_index(model, RELEASE_DATE_INDEX)
+
+
+def remove_release_date_index(apps, schema_editor):
+    model = apps.get_model('hospital', 'patientdischargedetails')
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.remove_index(model, RELEASE_DATE_INDEX, concurrently=True)
+    else:
+        schema_editor.remove_index(model, RELEASE_DATE_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('hospital', '0007_prefix_search_indexes'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='patientdischargedetails', index=RELEASE_DATE_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(add_release_date_index, remove_release_date_index),
+            ],
+        ),
+    ]
@@ -1,6 +1,11 @@
+from functools import cached_property
+
 from django.db import models
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import RegexValidator, MinLengthValidator
+from django.db.models.functions import Substr
 from django.utils import timezone
 
 
@@ -11,31 +16,63 @@ phone_validator = RegexValidator(
 )
 
 # Department choices
-departments = [
-    ('Cardiologist', 'Cardiologist'),
-    ('Dermatologists', 'Dermatologists'),
-    ('Emergency Medicine Specialists', 'Emergency Medicine Specialists'),
-    ('Allergists/Immunologists', 'Allergists/Immunologists'),
-    ('Anesthesiologists', 'Anesthesiologists'),
-    ('Colon and Rectal Surgeons', 'Colon and Rectal Surgeons'),
-    ('Endocrinologists', 'Endocrinologists'),
-    ('Gastroenterologists', 'Gastroenterologists'),
-    ('Neurologists', 'Neurologists'),
-    ('Oncologists', 'Oncologists'),
-    ('Ophthalmologists', 'Ophthalmologists'),
-    ('Orthopedic Surgeons', 'Orthopedic Surgeons'),
-    ('Pediatricians', 'Pediatricians'),
-    ('Psychiatrists', 'Psychiatrists'),
-    ('Radiologists', 'Radiologists'),
-    ('Urologists', 'Urologists'),
-]
+class Department(models.TextChoices):
+    CARDIOLOGIST = 'Cardiologist', 'Cardiologist'
+    DERMATOLOGISTS = 'Dermatologists', 'Dermatologists'
+    EMERGENCY_MEDICINE_SPECIALISTS = 'Emergency Medicine Specialists', 'Emergency Medicine Specialists'
+    ALLERGISTS_IMMUNOLOGISTS = 'Allergists/Immunologists', 'Allergists/Immunologists'
+    ANESTHESIOLOGISTS = 'Anesthesiologists', 'Anesthesiologists'
+    COLON_AND_RECTAL_SURGEONS = 'Colon and Rectal Surgeons', 'Colon and Rectal Surgeons'
+    ENDOCRINOLOGISTS = 'Endocrinologists', 'Endocrinologists'
+    GASTROENTEROLOGISTS = 'Gastroenterologists', 'Gastroenterologists'
+    NEUROLOGISTS = 'Neurologists', 'Neurologists'
+    ONCOLOGISTS = 'Oncologists', 'Oncologists'
+    OPHTHALMOLOGISTS = 'Ophthalmologists', 'Ophthalmologists'
+    ORTHOPEDIC_SURGEONS = 'Orthopedic Surgeons', 'Orthopedic Surgeons'
+    PEDIATRICIANS = 'Pediatricians', 'Pediatricians'
+    PSYCHIATRISTS = 'Psychiatrists', 'Psychiatrists'
+    RADIOLOGISTS = 'Radiologists', 'Radiologists'
+    UROLOGISTS = 'Urologists', 'Urologists'
+
+
+class Age(models.Func):
+    """Whole years between a date expression and today, computed by the database."""
+    template = 'EXTRACT(YEAR FROM AGE(CURRENT_DATE, %(expressions)s))::integer'
+    output_field = models.IntegerField()
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection,
+            template='TIMESTAMPDIFF(YEAR, %(expressions)s, CURDATE())',
+            **extra_context
+        )
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection,
+            template=(
+                "(CAST(strftime('%%%%Y', 'now') AS INTEGER) - CAST(strftime('%%%%Y', %(expressions)s) AS INTEGER)"
+                " - (strftime('%%%%m-%%%%d', 'now') < strftime('%%%%m-%%%%d', %(expressions)s)))"
+            ),
+            **extra_context
+        )
+
+
+class PatientQuerySet(models.QuerySet):
+    def with_age(self):
+        """Annotate ``age_years`` so iterating patients doesn't compute ages in Python."""
+        return self.annotate(age_years=Age('date_of_birth'))
+
+    def with_symptoms_preview(self):
+        """Annotate the first 51 characters of symptoms as ``symptoms_preview``; the 51st marks truncation."""
+        return self.annotate(symptoms_preview=Substr('symptoms', 1, 51))
 
 
 class BaseModel(models.Model):
     """Abstract base model with common fields"""
-    created_at = models.DateTimeField(default=timezone.now)
-    updated_at = models.DateTimeField(default=timezone.now)
-    is_active = models.BooleanField(default=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    is_active = models.BooleanField(default=True)
     
     class Meta:
         abstract = True
@@ -57,8 +94,8 @@ class Doctor(BaseModel):
     )
     department = models.CharField(
         max_length=50,
-        choices=departments,
-        default='Cardiologist',
+        choices=Department.choices,
+        default=Department.CARDIOLOGIST,
         db_index=True,
         help_text='Medical specialization'
     )
@@ -91,16 +128,16 @@ class Doctor(BaseModel):
             models.Index(fields=['department', 'status']),
         ]
     
-    @property
+    @cached_property
     def get_name(self):
         return f"{self.user.first_name} {self.user.last_name}"
     
     @property
     def get_id(self):
-        return self.user.id
+        return self.user_id
     
     def __str__(self):
-        return f"{self.user.first_name} {self.user.last_name} ({self.department})"
+        return f"{self.get_name} ({self.department})"
 
 
 class Patient(BaseModel):
@@ -159,39 +196,38 @@ class Patient(BaseModel):
         validators=[phone_validator],
         help_text='Emergency contact number'
     )
-    
-    # Backward compatibility field (deprecated)
-    assignedDoctorId = models.PositiveIntegerField(
+    search_vector = SearchVectorField(
         null=True,
-        blank=True,
         editable=False,
-        help_text='Legacy field - use assigned_doctor instead'
+        help_text='Full-text index of symptoms, maintained by a database trigger'
     )
     
+    objects = PatientQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-admit_date']
         verbose_name = 'Patient'
         verbose_name_plural = 'Patients'
         indexes = [
             models.Index(fields=['status', 'assigned_doctor']),
+            models.Index(fields=['assigned_doctor', '-admit_date']),
+            models.Index(fields=['status', 'blood_group']),
+            GinIndex(fields=['search_vector'], name='hospital_patient_search_gin'),
         ]
     
-    def save(self, *args, **kwargs):
-        # Maintain backward compatibility
-        if self.assigned_doctor:
-            self.assignedDoctorId = self.assigned_doctor.user.id
-        super().save(*args, **kwargs)
-    
-    @property
+    @cached_property
     def get_name(self):
         return f"{self.user.first_name} {self.user.last_name}"
     
     @property
     def get_id(self):
-        return self.user.id
+        return self.user_id
     
     @property
     def age(self):
+        # Prefer the value annotated by PatientQuerySet.with_age()
+        if 'age_years' in self.__dict__:
+            return self.age_years
         if self.date_of_birth:
             today = timezone.now().date()
             return today.year - self.date_of_birth.year - (
@@ -200,7 +236,11 @@ class Patient(BaseModel):
         return None
     
     def __str__(self):
-        return f"{self.user.first_name} {self.user.last_name} ({self.symptoms[:30]})"
+        # Prefer the value annotated by PatientQuerySet.with_symptoms_preview(),
+        # whose querysets may defer symptoms
+        if 'symptoms_preview' in self.__dict__:
+            return f"{self.get_name} ({self.symptoms_preview[:30]})"
+        return f"{self.get_name} ({self.symptoms[:30]})"
 
 
 class Appointment(BaseModel):
@@ -232,13 +272,6 @@ class Appointment(BaseModel):
         help_text='Approval status'
     )
     
-    # Backward compatibility fields (deprecated)
-    patientId = models.PositiveIntegerField(null=True, blank=True, editable=False)
-    doctorId = models.PositiveIntegerField(null=True, blank=True, editable=False)
-    patientName = models.CharField(max_length=100, blank=True, editable=False)
-    doctorName = models.CharField(max_length=100, blank=True, editable=False)
-    appointmentDate = models.DateField(null=True, blank=True, editable=False)
-    
     class Meta:
         ordering = ['-appointment_date']
         verbose_name = 'Appointment'
@@ -249,18 +282,6 @@ class Appointment(BaseModel):
             models.Index(fields=['patient', 'appointment_date']),
         ]
     
-    def save(self, *args, **kwargs):
-        # Maintain backward compatibility
-        if self.patient:
-            self.patientId = self.patient.user.id
-            self.patientName = self.patient.get_name
-        if self.doctor:
-            self.doctorId = self.doctor.user.id
-            self.doctorName = self.doctor.get_name
-        if self.appointment_date:
-            self.appointmentDate = self.appointment_date.date()
-        super().save(*args, **kwargs)
-    
     def __str__(self):
         return f"{self.patient.get_name} -> {self.doctor.get_name} on {self.appointment_date}"
 
@@ -310,44 +331,14 @@ class PatientDischargeDetails(BaseModel):
         help_text='Total bill amount'
     )
     
-    # Backward compatibility fields (deprecated)
-    patientId = models.PositiveIntegerField(null=True, blank=True, editable=False)
-    patientName = models.CharField(max_length=100, blank=True, editable=False)
-    assignedDoctorName = models.CharField(max_length=100, blank=True, editable=False)
-    address = models.CharField(max_length=200, blank=True, editable=False)
-    mobile = models.CharField(max_length=20, blank=True, editable=False)
-    symptoms = models.CharField(max_length=500, blank=True, editable=False)
-    admitDate = models.DateField(null=True, blank=True, editable=False)
-    releaseDate = models.DateField(null=True, blank=True, editable=False)
-    daySpent = models.PositiveIntegerField(null=True, blank=True, editable=False)
-    roomCharge = models.PositiveIntegerField(null=True, blank=True, editable=False)
-    medicineCost = models.PositiveIntegerField(null=True, blank=True, editable=False)
-    doctorFee = models.PositiveIntegerField(null=True, blank=True, editable=False)
-    OtherCharge = models.PositiveIntegerField(null=True, blank=True, editable=False)
-    
     class Meta:
         ordering = ['-release_date']
         verbose_name = 'Patient Discharge Detail'
         verbose_name_plural = 'Patient Discharge Details'
-    
-    def save(self, *args, **kwargs):
-        # Maintain backward compatibility
-        if self.patient:
-            self.patientId = self.patient.user.id
-            self.patientName = self.patient.get_name
-            self.address = self.patient.address
-            self.mobile = self.patient.mobile
-            self.symptoms = self.patient.symptoms
-        if self.assigned_doctor:
-            self.assignedDoctorName = self.assigned_doctor.get_name
-        self.admitDate = self.admit_date
-        self.releaseDate = self.release_date
-        self.daySpent = self.day_spent
-        self.roomCharge = int(self.room_charge)
-        self.medicineCost = int(self.medicine_cost)
-        self.doctorFee = int(self.doctor_fee)
-        self.OtherCharge = int(self.other_charge)
-        super().save(*args, **kwargs)
+        indexes = [
+            models.Index(fields=['assigned_doctor', '-release_date']),
+            models.Index(fields=['release_date']),
+        ]
     
     def __str__(self):
         return f"Discharge: {self.patient.get_name} on {self.release_date}"
@@ -0,0 +1,94 @@
+import calendar
+import datetime
+
+from django import template
+from django.contrib.admin.templatetags.base import InclusionAdminNode
+from django.db.models import Max, Min
+from django.utils import formats, timezone
+from django.utils.text import capfirst
+from django.utils.translation import gettext as _
+
+register = template.Library()
+
+
+def calendar_date_hierarchy(cl):
+    """
+    Date drill-down built from the calendar rather than from the changelist rows.
+
+    Django's ``date_hierarchy`` tag runs ``SELECT DISTINCT date_trunc(...)``
+    over the filtered table on every render. This one takes the year range
+    from MIN/MAX of the (indexed) date column and offers every month and
+    every day of the month without a query; picking an empty period just
+    shows an empty changelist.
+    """
+    field_name = cl.date_hierarchy
+    year_field = '%s__year' % field_name
+    month_field = '%s__month' % field_name
+    day_field = '%s__day' % field_name
+    year_lookup = cl.params.get(year_field)
+    month_lookup = cl.params.get(month_field)
+    day_lookup = cl.params.get(day_field)
+
+    def link(filters):
+        return cl.get_query_string(filters, ['%s__' % field_name])
+
+    if year_lookup and month_lookup and day_lookup:
+        day = datetime.date(int(year_lookup), int(month_lookup), int(day_lookup))
+        return {
+            'show': True,
+            'back': {
+                'link': link({year_field: year_lookup, month_field: month_lookup}),
+                'title': capfirst(formats.date_format(day, 'YEAR_MONTH_FORMAT')),
+            },
+            'choices': [{'title': capfirst(formats.date_format(day, 'MONTH_DAY_FORMAT'))}],
+        }
+    if year_lookup and month_lookup:
+        year, month = int(year_lookup), int(month_lookup)
+        return {
+            'show': True,
+            'back': {'link': link({year_field: year_lookup}), 'title': str(year_lookup)},
+            'choices': [
+                {
+                    'link': link({year_field: year_lookup, month_field: month_lookup, day_field: day}),
+                    'title': capfirst(formats.date_format(datetime.date(year, month, day), 'MONTH_DAY_FORMAT')),
+                }
+                for day in range(1, calendar.monthrange(year, month)[1] + 1)
+            ],
+        }
+    if year_lookup:
+        year = int(year_lookup)
+        return {
+            'show': True,
+            'back': {'link': link({}), 'title': _('All dates')},
+            'choices': [
+                {
+                    'link': link({year_field: year_lookup, month_field: month}),
+                    'title': capfirst(formats.date_format(datetime.date(year, month, 1), 'YEAR_MONTH_FORMAT')),
+                }
+                for month in range(1, 13)
+            ],
+        }
+    date_range = cl.queryset.aggregate(first=Min(field_name), last=Max(field_name))
+    years = []
+    if date_range['first'] and date_range['last']:
+        first, last = (
+            timezone.localtime(value) if isinstance(value, datetime.datetime) and timezone.is_aware(value) else value
+            for value in (date_range['first'], date_range['last'])
+        )
+        years = range(first.year, last.year + 1)
+    return {
+        'show': True,
+        'back': None,
+        'choices': [{'link': link({year_field: str(year)}), 'title': str(year)} for year in years],
+    }
+
+
+@register.tag(name='calendar_date_hierarchy')
+def calendar_date_hierarchy_tag(parser, token):
+    return InclusionAdminNode(
+        parser,
+        token,
+        func=calendar_date_hierarchy,
+        template_name='date_hierarchy.html',
+        takes_context=False,
+    )
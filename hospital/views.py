@@ -262,7 +262,7 @@ def admin_approve_doctor_view(request):
 def approve_doctor_view(request,pk):
     doctor=models.Doctor.objects.get(id=pk)
     doctor.status=True
-    doctor.save()
+    doctor.save(update_fields=['status','updated_at'])
     return redirect(reverse('admin-approve-doctor'))
 
 
@@ -391,7 +391,7 @@ def admin_approve_patient_view(request):
 def approve_patient_view(request,pk):
     patient=models.Patient.objects.get(id=pk)
     patient.status=True
-    patient.save()
+    patient.save(update_fields=['status','updated_at'])
     return redirect(reverse('admin-approve-patient'))
 
 
@@ -419,9 +419,9 @@ def admin_discharge_patient_view(request):
 @login_required(login_url='adminlogin')
 @user_passes_test(is_admin)
 def discharge_patient_view(request,pk):
-    patient=models.Patient.objects.get(id=pk)
-    days=(date.today()-patient.admitDate) #2 days, 0:00:00
-    assignedDoctor=models.User.objects.all().filter(id=patient.assignedDoctorId)
+    patient=models.Patient.objects.select_related('user','assigned_doctor__user').get(id=pk)
+    days=(date.today()-patient.admit_date) #2 days, 0:00:00
+    assignedDoctor=patient.assigned_doctor
     d=days.days # only how many day that is 2
     patientDict={
         'patientId':pk,
@@ -429,10 +429,10 @@ def discharge_patient_view(request,pk):
         'mobile':patient.mobile,
         'address':patient.address,
         'symptoms':patient.symptoms,
-        'admitDate':patient.admitDate,
+        'admitDate':patient.admit_date,
         'todayDate':date.today(),
         'day':d,
-        'assignedDoctorName':assignedDoctor[0].first_name,
+        'assignedDoctorName':assignedDoctor.user.first_name,
     }
     if request.method == 'POST':
         feeDict ={
@@ -446,14 +446,8 @@ def discharge_patient_view(request,pk):
         #for updating to database patientDischargeDetails (pDD)
         pDD=models.PatientDischargeDetails()
         pDD.patient=patient # Fix: Assign ForeignKey
-        pDD.patientId=pk
-        pDD.patientName=patient.get_name
-        pDD.assigned_doctor=assignedDoctor[0].doctor_profile # Fix: Assign ForeignKey
-        pDD.assignedDoctorName=assignedDoctor[0].first_name
-        pDD.address=patient.address
-        pDD.mobile=patient.mobile
-        pDD.symptoms=patient.symptoms
-        pDD.admit_date=patient.admitDate # Fix: Use correct field name
+        pDD.assigned_doctor=assignedDoctor # Fix: Assign ForeignKey
+        pDD.admit_date=patient.admit_date # Fix: Use correct field name
         pDD.release_date=date.today() # Fix: Use correct field name
         pDD.day_spent=int(d) # Fix: Use correct field name
         pDD.medicine_cost=int(request.POST['medicineCost']) # Fix: Use correct field name
@@ -487,20 +481,20 @@ def render_to_pdf(template_src, context_dict):
 
 
 def download_pdf_view(request,pk):
-    dischargeDetails=models.PatientDischargeDetails.objects.all().filter(patientId=pk).order_by('-id')[:1]
+    dischargeDetails=models.PatientDischargeDetails.objects.select_related('patient__user','assigned_doctor__user').filter(patient_id=pk).order_by('-id')[:1]
     dict={
-        'patientName':dischargeDetails[0].patientName,
-        'assignedDoctorName':dischargeDetails[0].assignedDoctorName,
-        'address':dischargeDetails[0].address,
-        'mobile':dischargeDetails[0].mobile,
-        'symptoms':dischargeDetails[0].symptoms,
-        'admitDate':dischargeDetails[0].admitDate,
-        'releaseDate':dischargeDetails[0].releaseDate,
-        'daySpent':dischargeDetails[0].daySpent,
-        'medicineCost':dischargeDetails[0].medicineCost,
-        'roomCharge':dischargeDetails[0].roomCharge,
-        'doctorFee':dischargeDetails[0].doctorFee,
-        'OtherCharge':dischargeDetails[0].OtherCharge,
+        'patientName':dischargeDetails[0].patient.get_name,
+        'assignedDoctorName':dischargeDetails[0].assigned_doctor.get_name if dischargeDetails[0].assigned_doctor else '',
+        'address':dischargeDetails[0].patient.address,
+        'mobile':dischargeDetails[0].patient.mobile,
+        'symptoms':dischargeDetails[0].patient.symptoms,
+        'admitDate':dischargeDetails[0].admit_date,
+        'releaseDate':dischargeDetails[0].release_date,
+        'daySpent':dischargeDetails[0].day_spent,
+        'medicineCost':dischargeDetails[0].medicine_cost,
+        'roomCharge':dischargeDetails[0].room_charge,
+        'doctorFee':dischargeDetails[0].doctor_fee,
+        'OtherCharge':dischargeDetails[0].other_charge,
         'total':dischargeDetails[0].total,
     }
     return render_to_pdf('hospital/download_bill.html',dict)
@@ -518,7 +512,7 @@ def admin_appointment_view(request):
 @login_required(login_url='adminlogin')
 @user_passes_test(is_admin)
 def admin_view_appointment_view(request):
-    appointments=models.Appointment.objects.all().filter(status=True)
+    appointments=models.Appointment.objects.select_related('patient__user','doctor__user').filter(status=True)
     return render(request,'hospital/admin_view_appointment.html',{'appointments':appointments})
 
 
@@ -553,7 +547,7 @@ def admin_add_appointment_view(request):
 @user_passes_test(is_admin)
 def admin_approve_appointment_view(request):
     #those whose approval are needed
-    appointments=models.Appointment.objects.all().filter(status=False)
+    appointments=models.Appointment.objects.select_related('patient__user','doctor__user').filter(status=False)
     return render(request,'hospital/admin_approve_appointment.html',{'appointments':appointments})
 
 
@@ -563,7 +557,7 @@ def admin_approve_appointment_view(request):
 def approve_appointment_view(request,pk):
     appointment=models.Appointment.objects.get(id=pk)
     appointment.status=True
-    appointment.save()
+    appointment.save(update_fields=['status','updated_at'])
     return redirect(reverse('admin-approve-appointment'))
 
 
@@ -590,16 +584,16 @@ def reject_appointment_view(request,pk):
 @user_passes_test(is_doctor)
 def doctor_dashboard_view(request):
     #for three cards
-    patientcount=models.Patient.objects.all().filter(status=True,assignedDoctorId=request.user.id).count()
-    appointmentcount=models.Appointment.objects.all().filter(status=True,doctorId=request.user.id).count()
-    patientdischarged=models.PatientDischargeDetails.objects.all().distinct().filter(assignedDoctorName=request.user.first_name).count()
+    patientcount=models.Patient.objects.all().filter(status=True,assigned_doctor__user_id=request.user.id).count()
+    appointmentcount=models.Appointment.objects.all().filter(status=True,doctor__user_id=request.user.id).count()
+    patientdischarged=models.PatientDischargeDetails.objects.all().distinct().filter(assigned_doctor__user_id=request.user.id).count()
 
     #for  table in doctor dashboard
-    appointments=models.Appointment.objects.all().filter(status=True,doctorId=request.user.id).order_by('-id')
+    appointments=models.Appointment.objects.select_related('patient__user').filter(status=True,doctor__user_id=request.user.id).order_by('-id')
     patientid=[]
     for a in appointments:
-        patientid.append(a.patientId)
-    patients=models.Patient.objects.all().filter(status=True,user_id__in=patientid).order_by('-id')
+        patientid.append(a.patient_id)
+    patients=models.Patient.objects.all().filter(status=True,id__in=patientid).order_by('-id')
     appointments=zip(appointments,patients)
     mydict={
     'patientcount':patientcount,
@@ -627,7 +621,7 @@ def doctor_patient_view(request):
 @login_required(login_url='doctorlogin')
 @user_passes_test(is_doctor)
 def doctor_view_patient_view(request):
-    patients=models.Patient.objects.all().filter(status=True,assignedDoctorId=request.user.id)
+    patients=models.Patient.objects.all().filter(status=True,assigned_doctor__user_id=request.user.id)
     doctor=models.Doctor.objects.get(user_id=request.user.id) #for profile picture of doctor in sidebar
     return render(request,'hospital/doctor_view_patient.html',{'patients':patients,'doctor':doctor})
 
@@ -638,7 +632,7 @@ def search_view(request):
     doctor=models.Doctor.objects.get(user_id=request.user.id) #for profile picture of doctor in sidebar
     # whatever user write in search box we get in query
     query = request.GET['query']
-    patients=models.Patient.objects.all().filter(status=True,assignedDoctorId=request.user.id).filter(Q(symptoms__icontains=query)|Q(user__first_name__icontains=query))
+    patients=models.Patient.objects.all().filter(status=True,assigned_doctor__user_id=request.user.id).filter(Q(symptoms__icontains=query)|Q(user__first_name__icontains=query))
     return render(request,'hospital/doctor_view_patient.html',{'patients':patients,'doctor':doctor})
 
 
@@ -646,7 +640,7 @@ def search_view(request):
 @login_required(login_url='doctorlogin')
 @user_passes_test(is_doctor)
 def doctor_view_discharge_patient_view(request):
-    dischargedpatients=models.PatientDischargeDetails.objects.all().distinct().filter(assignedDoctorName=request.user.first_name)
+    dischargedpatients=models.PatientDischargeDetails.objects.select_related('patient__user').distinct().filter(assigned_doctor__user_id=request.user.id)
     doctor=models.Doctor.objects.get(user_id=request.user.id) #for profile picture of doctor in sidebar
     return render(request,'hospital/doctor_view_discharge_patient.html',{'dischargedpatients':dischargedpatients,'doctor':doctor})
 
@@ -664,11 +658,11 @@ def doctor_appointment_view(request):
 @user_passes_test(is_doctor)
 def doctor_view_appointment_view(request):
     doctor=models.Doctor.objects.get(user_id=request.user.id) #for profile picture of doctor in sidebar
-    appointments=models.Appointment.objects.all().filter(status=True,doctorId=request.user.id)
+    appointments=models.Appointment.objects.select_related('patient__user').filter(status=True,doctor__user_id=request.user.id)
     patientid=[]
     for a in appointments:
-        patientid.append(a.patientId)
-    patients=models.Patient.objects.all().filter(status=True,user_id__in=patientid)
+        patientid.append(a.patient_id)
+    patients=models.Patient.objects.all().filter(status=True,id__in=patientid)
     appointments=zip(appointments,patients)
     return render(request,'hospital/doctor_view_appointment.html',{'appointments':appointments,'doctor':doctor})
 
@@ -678,11 +672,11 @@ def doctor_view_appointment_view(request):
 @user_passes_test(is_doctor)
 def doctor_delete_appointment_view(request):
     doctor=models.Doctor.objects.get(user_id=request.user.id) #for profile picture of doctor in sidebar
-    appointments=models.Appointment.objects.all().filter(status=True,doctorId=request.user.id)
+    appointments=models.Appointment.objects.select_related('patient__user').filter(status=True,doctor__user_id=request.user.id)
     patientid=[]
     for a in appointments:
-        patientid.append(a.patientId)
-    patients=models.Patient.objects.all().filter(status=True,user_id__in=patientid)
+        patientid.append(a.patient_id)
+    patients=models.Patient.objects.all().filter(status=True,id__in=patientid)
     appointments=zip(appointments,patients)
     return render(request,'hospital/doctor_delete_appointment.html',{'appointments':appointments,'doctor':doctor})
 
@@ -694,11 +688,11 @@ def delete_appointment_view(request,pk):
     appointment=models.Appointment.objects.get(id=pk)
     appointment.delete()
     doctor=models.Doctor.objects.get(user_id=request.user.id) #for profile picture of doctor in sidebar
-    appointments=models.Appointment.objects.all().filter(status=True,doctorId=request.user.id)
+    appointments=models.Appointment.objects.select_related('patient__user').filter(status=True,doctor__user_id=request.user.id)
     patientid=[]
     for a in appointments:
-        patientid.append(a.patientId)
-    patients=models.Patient.objects.all().filter(status=True,user_id__in=patientid)
+        patientid.append(a.patient_id)
+    patients=models.Patient.objects.all().filter(status=True,id__in=patientid)
     appointments=zip(appointments,patients)
     return render(request,'hospital/doctor_delete_appointment.html',{'appointments':appointments,'doctor':doctor})
 
@@ -719,8 +713,8 @@ def delete_appointment_view(request,pk):
 @login_required(login_url='patientlogin')
 @user_passes_test(is_patient)
 def patient_dashboard_view(request):
-    patient=models.Patient.objects.get(user_id=request.user.id)
-    doctor=models.Doctor.objects.get(user_id=patient.assignedDoctorId)
+    patient=models.Patient.objects.select_related('assigned_doctor__user').get(user_id=request.user.id)
+    doctor=patient.assigned_doctor
     mydict={
     'patient':patient,
     'doctorName':doctor.get_name,
@@ -728,7 +722,7 @@ def patient_dashboard_view(request):
     'doctorAddress':doctor.address,
     'symptoms':patient.symptoms,
     'doctorDepartment':doctor.department,
-    'admitDate':patient.admitDate,
+    'admitDate':patient.admit_date,
     }
     return render(request,'hospital/patient_dashboard.html',context=mydict)
 
@@ -793,7 +787,7 @@ def search_doctor_view(request):
 @user_passes_test(is_patient)
 def patient_view_appointment_view(request):
     patient=models.Patient.objects.get(user_id=request.user.id) #for profile picture of patient in sidebar
-    appointments=models.Appointment.objects.all().filter(patientId=request.user.id)
+    appointments=models.Appointment.objects.select_related('doctor__user').filter(patient=patient)
     return render(request,'hospital/patient_view_appointment.html',{'appointments':appointments,'patient':patient})
 
 
@@ -802,7 +796,7 @@ def patient_view_appointment_view(request):
 @user_passes_test(is_patient)
 def patient_discharge_view(request):
     patient=models.Patient.objects.get(user_id=request.user.id) #for profile picture of patient in sidebar
-    dischargeDetails=models.PatientDischargeDetails.objects.all().filter(patientId=patient.id).order_by('-id')[:1]
+    dischargeDetails=models.PatientDischargeDetails.objects.select_related('assigned_doctor__user').filter(patient=patient).order_by('-id')[:1]
     patientDict=None
     if dischargeDetails:
         patientDict ={
@@ -810,17 +804,17 @@ def patient_discharge_view(request):
         'patient':patient,
         'patientId':patient.id,
         'patientName':patient.get_name,
-        'assignedDoctorName':dischargeDetails[0].assignedDoctorName,
+        'assignedDoctorName':dischargeDetails[0].assigned_doctor.get_name if dischargeDetails[0].assigned_doctor else '',
         'address':patient.address,
         'mobile':patient.mobile,
         'symptoms':patient.symptoms,
-        'admitDate':patient.admitDate,
-        'releaseDate':dischargeDetails[0].releaseDate,
-        'daySpent':dischargeDetails[0].daySpent,
-        'medicineCost':dischargeDetails[0].medicineCost,
-        'roomCharge':dischargeDetails[0].roomCharge,
-        'doctorFee':dischargeDetails[0].doctorFee,
-        'OtherCharge':dischargeDetails[0].OtherCharge,
+        'admitDate':patient.admit_date,
+        'releaseDate':dischargeDetails[0].release_date,
+        'daySpent':dischargeDetails[0].day_spent,
+        'medicineCost':dischargeDetails[0].medicine_cost,
+        'roomCharge':dischargeDetails[0].room_charge,
+        'doctorFee':dischargeDetails[0].doctor_fee,
+        'OtherCharge':dischargeDetails[0].other_charge,
         'total':dischargeDetails[0].total,
         }
         print(patientDict)
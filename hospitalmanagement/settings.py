@@ -90,6 +90,11 @@ DATABASES = {
     }
 }
 
+# Registers the trigram lookups used by the admin search; it needs psycopg,
+# so only PostgreSQL deployments load it.
+if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    INSTALLED_APPS.append('django.contrib.postgres')
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.0/ref/settings/#auth-password-validators
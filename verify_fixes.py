@@ -5,27 +5,36 @@ from datetime import date
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'hospitalmanagement.settings')
 django.setup()
 
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
-from hospital.models import Doctor, Patient, Appointment, PatientDischargeDetails
+from hospital.models import Department, Doctor, Patient, Appointment, PatientDischargeDetails
 
 def verify_relationships():
     print("Verifying relationships...")
 
-    # 1. Create Doctor
+    # 1. Create both Users in a single INSERT
+    # bulk_create() skips save(), so hash the password up front. SQLite 3.35+
+    # and PostgreSQL return the new primary keys, so no re-read is needed.
+    print("Creating Users...")
+    password = make_password('password')
+    doc_user, pat_user = User.objects.bulk_create([
+        User(username='testdoc', password=password),
+        User(username='testpat', password=password),
+    ])
+
+    # 2. Create Doctor
     print("Creating Doctor...")
-    doc_user = User.objects.create_user(username='testdoc', password='password')
     doctor = Doctor.objects.create(
         user=doc_user,
         address="123 Doc St",
         mobile="1234567890",
-        department="Cardiologist",
+        department=Department.CARDIOLOGIST,
         status=True
     )
     print(f"Doctor created: {doctor}")
 
-    # 2. Create Patient and assign Doctor via FK
+    # 3. Create Patient and assign Doctor via FK
     print("Creating Patient...")
-    pat_user = User.objects.create_user(username='testpat', password='password')
     patient = Patient.objects.create(
         user=pat_user,
         address="456 Pat St",
@@ -36,13 +45,12 @@ def verify_relationships():
     )
     print(f"Patient created: {patient}")
 
-    # Verify Legacy Field Sync
-    print(f"Patient assignedDoctorId (Legacy): {patient.assignedDoctorId}")
-    print(f"Doctor User ID: {doc_user.id}")
-    assert patient.assignedDoctorId == doc_user.id, "Patient assignedDoctorId not synced!"
-    print("PASS: Patient assignedDoctorId synced correctly.")
+    # Verify ForeignKey
+    print(f"Patient assigned_doctor: {patient.assigned_doctor}")
+    assert Patient.objects.get(pk=patient.pk).assigned_doctor_id == doctor.id, "Patient assigned_doctor not saved!"
+    print("PASS: Patient assigned_doctor saved correctly.")
 
-    # 3. Create Appointment via FK
+    # 4. Create Appointment via FK
     print("Creating Appointment...")
     appointment = Appointment.objects.create(
         doctor=doctor,
@@ -52,14 +60,13 @@ def verify_relationships():
     )
     print(f"Appointment created: {appointment}")
 
-    # Verify Legacy Fields Sync
-    print(f"Appointment doctorId (Legacy): {appointment.doctorId}")
-    print(f"Appointment patientId (Legacy): {appointment.patientId}")
-    assert appointment.doctorId == doc_user.id, "Appointment doctorId not synced!"
-    assert appointment.patientId == pat_user.id, "Appointment patientId not synced!"
-    print("PASS: Appointment legacy fields synced correctly.")
+    # Verify ForeignKeys
+    saved = Appointment.objects.select_related('doctor__user', 'patient__user').get(pk=appointment.pk)
+    assert saved.doctor.user_id == doc_user.id, "Appointment doctor not saved!"
+    assert saved.patient.user_id == pat_user.id, "Appointment patient not saved!"
+    print("PASS: Appointment foreign keys saved correctly.")
 
-    # 4. Create Discharge Details via FK
+    # 5. Create Discharge Details via FK
     print("Creating Discharge Details...")
     discharge = PatientDischargeDetails.objects.create(
         patient=patient,
@@ -75,20 +82,14 @@ def verify_relationships():
     )
     print(f"Discharge created: {discharge}")
 
-    # Verify Legacy Fields Sync
-    print(f"Discharge patientId (Legacy): {discharge.patientId}")
-    print(f"Discharge assignedDoctorName (Legacy): {discharge.assignedDoctorName}")
-    assert discharge.patientId == pat_user.id, "Discharge patientId not synced!"
-    assert discharge.assignedDoctorName == doctor.get_name, "Discharge assignedDoctorName not synced!"
-    print("PASS: Discharge legacy fields synced correctly.")
+    # Verify ForeignKeys
+    saved = PatientDischargeDetails.objects.select_related('patient__user', 'assigned_doctor__user').get(pk=discharge.pk)
+    assert saved.patient.user_id == pat_user.id, "Discharge patient not saved!"
+    assert saved.assigned_doctor.get_name == doctor.get_name, "Discharge assigned_doctor not saved!"
+    print("PASS: Discharge foreign keys saved correctly.")
 
-    # Cleanup
-    discharge.delete()
-    appointment.delete()
-    patient.delete()
-    doctor.delete()
-    pat_user.delete()
-    doc_user.delete()
+    # Cleanup (cascades to the profiles, appointment and discharge)
+    User.objects.filter(pk__in=[doc_user.pk, pat_user.pk]).delete()
     print("Cleanup complete.")
 
 if __name__ == '__main__':